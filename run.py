@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Development runner for tte-screensaver."""
 
+import multiprocessing
 import sys
 import os
 
@@ -10,4 +11,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 from src.main import main
 
 if __name__ == "__main__":
+    # Effect worker processes re-enter the frozen executable
+    multiprocessing.freeze_support()
     main()
@@ -1,10 +1,17 @@
 """Configuration management for tte-screensaver."""
 
+import functools
 import json
 import os
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Default effects to cycle through - all available effects
@@ -66,21 +73,39 @@ class Config:
     background_color: Tuple[int, int, int] = (0, 0, 0)
     target_fps: int = 120  # Match Omarchy
 
+    def copy(self) -> "Config":
+        """Return a copy that shares no mutable state with this config."""
+        return replace(self, enabled_effects=list(self.enabled_effects))
+
     def to_dict(self) -> dict:
         """Convert config to dictionary for JSON serialization."""
-        return asdict(self)
+        # Flat dataclass - build the dict directly instead of asdict()'s deep copy
+        return {
+            "ascii_art": self.ascii_art,
+            "enabled_effects": self.enabled_effects,
+            "font_size": self.font_size,
+            "background_color": list(self.background_color),
+            "target_fps": self.target_fps,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Config":
         """Create config from dictionary."""
-        # Handle tuple conversion for background_color
-        if "background_color" in data and isinstance(data["background_color"], list):
-            data["background_color"] = tuple(data["background_color"])
-        return cls(**data)
-
-
+        # Copy so the caller's dict isn't mutated; JSON gives us a list here
+        kwargs = dict(data)
+        background_color = kwargs.get("background_color")
+        if background_color is not None:
+            kwargs["background_color"] = tuple(background_color)
+        # Intern names parsed from JSON so effect-registry lookups hit identity
+        enabled_effects = kwargs.get("enabled_effects")
+        if enabled_effects is not None:
+            kwargs["enabled_effects"] = [sys.intern(name) for name in enabled_effects]
+        return cls(**kwargs)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get the configuration file path in AppData."""
+    """Get the configuration file path in AppData (created once, then cached)."""
     if os.name == "nt":
         # Windows: use APPDATA
         appdata = os.environ.get("APPDATA", os.path.expanduser("~"))
@@ -93,28 +118,57 @@ def get_config_path() -> Path:
     return config_dir / "config.json"
 
 
+# Last loaded/saved config, keyed by the file's mtime. Never handed out
+# directly - callers get a copy they are free to modify
+_cached_config: Optional[Tuple[float, Config]] = None
+
+
 def load_config() -> Config:
     """Load configuration from file, or return defaults if not found."""
+    global _cached_config
     config_path = get_config_path()
 
-    if config_path.exists():
-        try:
+    try:
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        return Config()
+
+    # Skip re-reading the file if it hasn't changed since we last saw it
+    if _cached_config is not None and _cached_config[0] == mtime:
+        return _cached_config[1].copy()
+
+    try:
+        if orjson is not None:
+            with open(config_path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
             with open(config_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            return Config.from_dict(data)
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
-            print(f"Warning: Could not load config ({e}), using defaults")
-            return Config()
+        config = Config.from_dict(data)
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        print(f"Warning: Could not load config ({e}), using defaults")
+        return Config()
 
-    return Config()
+    _cached_config = (mtime, config.copy())
+    return config
 
 
 def save_config(config: Config) -> None:
     """Save configuration to file."""
+    global _cached_config
     config_path = get_config_path()
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config.to_dict(), f, indent=2)
+    # Write to a temp file and swap it in, so readers never see partial JSON
+    tmp_path = config_path.with_suffix(".json.tmp")
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(config.to_dict(), f, indent=2)
+    os.replace(tmp_path, config_path)
+
+    _cached_config = (config_path.stat().st_mtime, config.copy())
 
 
 def get_default_ascii_path() -> Path:
@@ -127,7 +181,6 @@ def get_default_ascii_path() -> Path:
         return assets_path
 
     # When running as frozen executable
-    import sys
     if getattr(sys, "frozen", False):
         base_path = Path(sys._MEIPASS)
         return base_path / "assets" / "default_ascii.txt"
@@ -70,13 +70,13 @@ class ConfigDialog:
 
         # Effects frame - simple grid, no scrolling needed
         effects_frame = ttk.Frame(main_frame)
-        effects_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Create checkboxes for each effect in a 5-column grid
         available_effects = get_available_effect_names()
+        enabled_set = set(self.config.enabled_effects)
         num_cols = 5
         for idx, effect_name in enumerate(available_effects):
-            var = tk.BooleanVar(value=effect_name in self.config.enabled_effects)
+            var = tk.BooleanVar(value=effect_name in enabled_set)
             self.effect_vars[effect_name] = var
 
             row = idx // num_cols
@@ -89,6 +89,9 @@ class ConfigDialog:
         for col in range(num_cols):
             effects_frame.columnconfigure(col, weight=1)
 
+        # Pack only once populated so Tk lays out the grid in a single pass
+        effects_frame.pack(fill=tk.X, pady=(0, 10))
+
         # Settings section
         settings_frame = ttk.LabelFrame(main_frame, text="Settings", padding="10")
         settings_frame.pack(fill=tk.X, pady=(0, 10))
@@ -149,19 +152,16 @@ class ConfigDialog:
 
     def _validate_and_get_config(self) -> Config | None:
         """Validate inputs and return new config, or None if invalid."""
-        try:
-            font_size = int(self.font_var.get())
-            if font_size <= 0:
-                raise ValueError("Font size must be positive")
-        except ValueError:
+        # isdecimal() accepts exactly the digits int() does, so no try/except needed
+        font_text = self.font_var.get().strip()
+        font_size = int(font_text) if font_text.isdecimal() else 0
+        if font_size <= 0:
             messagebox.showerror("Error", "Invalid font size. Must be a positive integer.")
             return None
 
-        try:
-            fps = int(self.fps_var.get())
-            if fps <= 0:
-                raise ValueError("FPS must be positive")
-        except ValueError:
+        fps_text = self.fps_var.get().strip()
+        fps = int(fps_text) if fps_text.isdecimal() else 0
+        if fps <= 0:
             messagebox.showerror("Error", "Invalid FPS. Must be a positive integer.")
             return None
 
@@ -1,90 +1,82 @@
 """Effect management and cycling for tte-screensaver."""
 
+import functools
+import importlib
+import multiprocessing
+import queue
 import random
-import threading
-from typing import Iterator, Optional, Dict, Type, List
-
-# Import all available TTE effects
-from terminaltexteffects.effects.effect_beams import Beams
-from terminaltexteffects.effects.effect_binarypath import BinaryPath
-from terminaltexteffects.effects.effect_blackhole import Blackhole
-from terminaltexteffects.effects.effect_bouncyballs import BouncyBalls
-from terminaltexteffects.effects.effect_bubbles import Bubbles
-from terminaltexteffects.effects.effect_burn import Burn
-from terminaltexteffects.effects.effect_colorshift import ColorShift
-from terminaltexteffects.effects.effect_crumble import Crumble
-from terminaltexteffects.effects.effect_decrypt import Decrypt
-from terminaltexteffects.effects.effect_errorcorrect import ErrorCorrect
-from terminaltexteffects.effects.effect_expand import Expand
-from terminaltexteffects.effects.effect_fireworks import Fireworks
-from terminaltexteffects.effects.effect_highlight import Highlight
-from terminaltexteffects.effects.effect_laseretch import LaserEtch
-from terminaltexteffects.effects.effect_matrix import Matrix
-from terminaltexteffects.effects.effect_middleout import MiddleOut
-from terminaltexteffects.effects.effect_orbittingvolley import OrbittingVolley
-from terminaltexteffects.effects.effect_overflow import Overflow
-from terminaltexteffects.effects.effect_pour import Pour
-from terminaltexteffects.effects.effect_print import Print
-from terminaltexteffects.effects.effect_rain import Rain
-from terminaltexteffects.effects.effect_random_sequence import RandomSequence
-from terminaltexteffects.effects.effect_rings import Rings
-from terminaltexteffects.effects.effect_scattered import Scattered
-from terminaltexteffects.effects.effect_slice import Slice
-from terminaltexteffects.effects.effect_slide import Slide
-from terminaltexteffects.effects.effect_spotlights import Spotlights
-from terminaltexteffects.effects.effect_spray import Spray
-from terminaltexteffects.effects.effect_swarm import Swarm
-from terminaltexteffects.effects.effect_sweep import Sweep
-from terminaltexteffects.effects.effect_synthgrid import SynthGrid
-from terminaltexteffects.effects.effect_unstable import Unstable
-from terminaltexteffects.effects.effect_vhstape import VHSTape
-from terminaltexteffects.effects.effect_waves import Waves
-from terminaltexteffects.effects.effect_wipe import Wipe
-
-
-# Map of effect names to their classes
-AVAILABLE_EFFECTS: Dict[str, Type] = {
-    "Beams": Beams,
-    "BinaryPath": BinaryPath,
-    "Blackhole": Blackhole,
-    "BouncyBalls": BouncyBalls,
-    "Bubbles": Bubbles,
-    "Burn": Burn,
-    "ColorShift": ColorShift,
-    "Crumble": Crumble,
-    "Decrypt": Decrypt,
-    "ErrorCorrect": ErrorCorrect,
-    "Expand": Expand,
-    "Fireworks": Fireworks,
-    "Highlight": Highlight,
-    "LaserEtch": LaserEtch,
-    "Matrix": Matrix,
-    "MiddleOut": MiddleOut,
-    "OrbittingVolley": OrbittingVolley,
-    "Overflow": Overflow,
-    "Pour": Pour,
-    "Print": Print,
-    "Rain": Rain,
-    "RandomSequence": RandomSequence,
-    "Rings": Rings,
-    "Scattered": Scattered,
-    "Slice": Slice,
-    "Slide": Slide,
-    "Spotlights": Spotlights,
-    "Spray": Spray,
-    "Swarm": Swarm,
-    "Sweep": Sweep,
-    "SynthGrid": SynthGrid,
-    "Unstable": Unstable,
-    "VHSTape": VHSTape,
-    "Waves": Waves,
-    "Wipe": Wipe,
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Optional, Dict, Type, List, Tuple
+
+# Map of effect names to (module, class) - classes are imported on first use
+# so showing the config dialog doesn't pull in every effect module
+AVAILABLE_EFFECTS: Dict[str, Tuple[str, str]] = {
+    "Beams": ("terminaltexteffects.effects.effect_beams", "Beams"),
+    "BinaryPath": ("terminaltexteffects.effects.effect_binarypath", "BinaryPath"),
+    "Blackhole": ("terminaltexteffects.effects.effect_blackhole", "Blackhole"),
+    "BouncyBalls": ("terminaltexteffects.effects.effect_bouncyballs", "BouncyBalls"),
+    "Bubbles": ("terminaltexteffects.effects.effect_bubbles", "Bubbles"),
+    "Burn": ("terminaltexteffects.effects.effect_burn", "Burn"),
+    "ColorShift": ("terminaltexteffects.effects.effect_colorshift", "ColorShift"),
+    "Crumble": ("terminaltexteffects.effects.effect_crumble", "Crumble"),
+    "Decrypt": ("terminaltexteffects.effects.effect_decrypt", "Decrypt"),
+    "ErrorCorrect": ("terminaltexteffects.effects.effect_errorcorrect", "ErrorCorrect"),
+    "Expand": ("terminaltexteffects.effects.effect_expand", "Expand"),
+    "Fireworks": ("terminaltexteffects.effects.effect_fireworks", "Fireworks"),
+    "Highlight": ("terminaltexteffects.effects.effect_highlight", "Highlight"),
+    "LaserEtch": ("terminaltexteffects.effects.effect_laseretch", "LaserEtch"),
+    "Matrix": ("terminaltexteffects.effects.effect_matrix", "Matrix"),
+    "MiddleOut": ("terminaltexteffects.effects.effect_middleout", "MiddleOut"),
+    "OrbittingVolley": ("terminaltexteffects.effects.effect_orbittingvolley", "OrbittingVolley"),
+    "Overflow": ("terminaltexteffects.effects.effect_overflow", "Overflow"),
+    "Pour": ("terminaltexteffects.effects.effect_pour", "Pour"),
+    "Print": ("terminaltexteffects.effects.effect_print", "Print"),
+    "Rain": ("terminaltexteffects.effects.effect_rain", "Rain"),
+    "RandomSequence": ("terminaltexteffects.effects.effect_random_sequence", "RandomSequence"),
+    "Rings": ("terminaltexteffects.effects.effect_rings", "Rings"),
+    "Scattered": ("terminaltexteffects.effects.effect_scattered", "Scattered"),
+    "Slice": ("terminaltexteffects.effects.effect_slice", "Slice"),
+    "Slide": ("terminaltexteffects.effects.effect_slide", "Slide"),
+    "Spotlights": ("terminaltexteffects.effects.effect_spotlights", "Spotlights"),
+    "Spray": ("terminaltexteffects.effects.effect_spray", "Spray"),
+    "Swarm": ("terminaltexteffects.effects.effect_swarm", "Swarm"),
+    "Sweep": ("terminaltexteffects.effects.effect_sweep", "Sweep"),
+    "SynthGrid": ("terminaltexteffects.effects.effect_synthgrid", "SynthGrid"),
+    "Unstable": ("terminaltexteffects.effects.effect_unstable", "Unstable"),
+    "VHSTape": ("terminaltexteffects.effects.effect_vhstape", "VHSTape"),
+    "Waves": ("terminaltexteffects.effects.effect_waves", "Waves"),
+    "Wipe": ("terminaltexteffects.effects.effect_wipe", "Wipe"),
 }
 
+# Frames buffered per worker process - enough to ride out a slow frame
+# without letting a fast effect run far ahead of the screen
+FRAME_QUEUE_SIZE = 8
+
+# Played when none of the configured effects are known
+FALLBACK_EFFECTS: Tuple[str, ...] = ("Matrix", "Rain", "Decrypt")
+
+# Sorted once - the registry is fixed at import time
+_AVAILABLE_EFFECT_NAMES: Tuple[str, ...] = tuple(sorted(AVAILABLE_EFFECTS))
+
+
+def get_available_effect_names() -> Tuple[str, ...]:
+    """Return all available effect names, sorted."""
+    return _AVAILABLE_EFFECT_NAMES
+
 
-def get_available_effect_names() -> List[str]:
-    """Return a list of all available effect names."""
-    return sorted(AVAILABLE_EFFECTS.keys())
+def filter_enabled_effects(enabled_effects: List[str]) -> Tuple[str, ...]:
+    """Return the known effects among enabled_effects, or the fallback set if none are."""
+    valid = tuple(name for name in enabled_effects if name in AVAILABLE_EFFECTS)
+    return valid or FALLBACK_EFFECTS
+
+
+@functools.cache
+def _resolve_effect_class(name: str) -> Type:
+    """Import and return the effect class registered under the given name."""
+    module_name, class_name = AVAILABLE_EFFECTS[name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class EffectManager:
@@ -102,12 +94,8 @@ class EffectManager:
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
 
-        # Filter enabled effects to only valid ones
-        self.enabled_effects = [
-            name for name in enabled_effects if name in AVAILABLE_EFFECTS
-        ]
-        if not self.enabled_effects:
-            self.enabled_effects = ["Matrix", "Rain", "Decrypt"]
+        # Filter enabled effects to only valid ones (fixed for our lifetime)
+        self.enabled_effects: Tuple[str, ...] = filter_enabled_effects(enabled_effects)
 
         # Don't shuffle - use truly random selection each time
         # This prevents monitors from syncing up
@@ -119,11 +107,10 @@ class EffectManager:
             self._current_index = random.randint(0, len(self.enabled_effects) - 1)
 
         self._current_iterator: Optional[Iterator[str]] = None
-        self._next_iterator: Optional[Iterator[str]] = None
+        self._next_future: Optional[Future] = None
         self._next_index: Optional[int] = None
-        self._effect_completed = False
-        self._preload_lock = threading.Lock()
-        self._preload_ready = threading.Event()
+        # Single long-lived worker builds the next effect while this one plays
+        self._preload_pool = ThreadPoolExecutor(max_workers=1)
 
         # Create first effect (blocking - need it now)
         self._current_iterator = self._create_effect_iterator(self._current_index)
@@ -133,7 +120,7 @@ class EffectManager:
     def _create_effect_iterator(self, index: int) -> Iterator[str]:
         """Create an effect iterator for the given index."""
         effect_name = self.enabled_effects[index]
-        effect_class = AVAILABLE_EFFECTS[effect_name]
+        effect_class = _resolve_effect_class(effect_name)
 
         effect = effect_class(self.text)
         effect.terminal_config.ignore_terminal_dimensions = True
@@ -145,46 +132,47 @@ class EffectManager:
         return iter(effect)
 
     def _start_background_preload(self) -> None:
-        """Start pre-loading next effect in background thread."""
-        self._preload_ready.clear()
-        thread = threading.Thread(target=self._preload_worker, daemon=True)
-        thread.start()
-
-    def _preload_worker(self) -> None:
-        """Background worker to create next effect."""
-        if len(self.enabled_effects) > 1:
-            choices = [i for i in range(len(self.enabled_effects)) if i != self._current_index]
-            next_idx = random.choice(choices)
+        """Queue creation of the next effect on the preload worker."""
+        num_effects = len(self.enabled_effects)
+        if num_effects > 1:
+            # Pick uniformly from every index except the current one
+            next_idx = random.randrange(num_effects - 1)
+            if next_idx >= self._current_index:
+                next_idx += 1
         else:
             next_idx = 0
 
-        # Create the effect (this is the slow part)
-        next_iter = self._create_effect_iterator(next_idx)
-
-        # Store results thread-safely
-        with self._preload_lock:
-            self._next_index = next_idx
-            self._next_iterator = next_iter
-        self._preload_ready.set()
+        # Create the effect off the render thread (this is the slow part)
+        self._next_index = next_idx
+        self._next_future = self._preload_pool.submit(self._create_effect_iterator, next_idx)
 
     def get_current_effect_name(self) -> str:
         """Get the name of the currently active effect."""
         return self.enabled_effects[self._current_index]
 
-    def switch_to_next_effect(self) -> None:
-        """Switch to the pre-loaded next effect (instant, no stutter)."""
-        # Wait for pre-load if not ready (should be ready by now)
-        self._preload_ready.wait(timeout=0.1)
+    def switch_to_next_effect(self) -> bool:
+        """
+        Switch to the pre-loaded next effect (instant, no stutter).
+        Returns False if the next effect wasn't ready yet.
+        """
+        # Never block the render loop - if the next effect is still being
+        # built, the caller just retries on the next frame
+        if not self._next_future.done():
+            return False
 
-        with self._preload_lock:
-            if self._next_iterator is not None:
-                self._current_index = self._next_index
-                self._current_iterator = self._next_iterator
-                self._next_iterator = None
-            self._effect_completed = False
+        try:
+            next_iter = self._next_future.result()
+        except Exception:
+            # Effect failed to construct, pick another one
+            self._start_background_preload()
+            return False
+
+        self._current_index = self._next_index
+        self._current_iterator = next_iter
 
         # Start background pre-load of the NEXT next effect
         self._start_background_preload()
+        return True
 
     def get_next_frame(self) -> Optional[str]:
         """Get the next frame. Returns None when effect completes or errors."""
@@ -194,10 +182,149 @@ class EffectManager:
         try:
             return next(self._current_iterator)
         except StopIteration:
-            self._effect_completed = True
             return None
         except Exception:
             # Some TTE effects have bugs (e.g., Blackhole IndexError)
             # Gracefully skip to next effect
-            self._effect_completed = True
             return None
+
+
+class _WorkerError:
+    """Sent in place of a frame when the worker process fails."""
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _put_frame(frames: "multiprocessing.Queue", frame, stop_event) -> None:
+    """Queue a frame, waiting for room unless the worker is being stopped."""
+    while not stop_event.is_set():
+        try:
+            frames.put(frame, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _effect_worker(
+    frames: "multiprocessing.Queue",
+    stop_event,
+    text: str,
+    enabled_effects: List[str],
+    canvas_width: int,
+    canvas_height: int,
+    start_index: Optional[int],
+) -> None:
+    """Worker process body - run an EffectManager and stream its frames."""
+    # Frames still buffered at shutdown are stale - don't hold up exit
+    # flushing them into a pipe nobody reads anymore
+    frames.cancel_join_thread()
+    try:
+        _run_effect_worker(
+            frames, stop_event, text, enabled_effects, canvas_width, canvas_height, start_index
+        )
+    except Exception as e:
+        traceback.print_exc()
+        # Hand the error to the renderer, then stay alive until it stops us -
+        # exiting now could drop the message still sitting in the queue's
+        # feeder thread
+        _put_frame(frames, _WorkerError(f"{type(e).__name__}: {e}"), stop_event)
+        stop_event.wait()
+
+
+def _run_effect_worker(
+    frames: "multiprocessing.Queue",
+    stop_event,
+    text: str,
+    enabled_effects: List[str],
+    canvas_width: int,
+    canvas_height: int,
+    start_index: Optional[int],
+) -> None:
+    """Run an EffectManager and queue its frames until told to stop."""
+    manager = EffectManager(text, enabled_effects, canvas_width, canvas_height, start_index)
+    effect_ended = False
+
+    while not stop_event.is_set():
+        frame = manager.get_next_frame()
+
+        if frame is None:
+            # Tell the renderer once, then wait here (not in the render
+            # loop) for the pre-loaded effect to be ready
+            if not effect_ended:
+                _put_frame(frames, None, stop_event)
+                effect_ended = True
+            if manager.switch_to_next_effect():
+                effect_ended = False
+            else:
+                time.sleep(0.01)
+            continue
+
+        _put_frame(frames, frame, stop_event)
+
+
+class EffectProcess:
+    """
+    Runs an EffectManager in its own process and streams frames back.
+
+    TTE effects generate frames in pure Python, so a process per monitor
+    keeps generation off the render process (and off its GIL). The worker
+    switches effects by itself, so callers only ever call get_next_frame.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        enabled_effects: List[str],
+        canvas_width: int = 80,
+        canvas_height: int = 24,
+        start_index: Optional[int] = None,
+    ):
+        # Spawn everywhere (as on Windows) - forking a process that already
+        # runs SDL isn't safe
+        context = multiprocessing.get_context("spawn")
+        self._frames = context.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=_effect_worker,
+            args=(
+                self._frames,
+                self._stop_event,
+                text,
+                list(enabled_effects),
+                canvas_width,
+                canvas_height,
+                start_index,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+
+    def get_next_frame(self) -> Optional[str]:
+        """
+        Get the next frame without blocking. Returns None when an effect
+        completes, or an empty string if the worker hasn't caught up yet.
+        Raises RuntimeError if the worker process has failed.
+        """
+        try:
+            frame = self._frames.get_nowait()
+        except queue.Empty:
+            # An empty queue is normal - unless nobody is left to fill it
+            if self._process.exitcode is not None:
+                raise RuntimeError(
+                    f"Effect worker exited unexpectedly (exit code {self._process.exitcode})"
+                )
+            return ""
+
+        if isinstance(frame, _WorkerError):
+            raise RuntimeError(f"Effect worker failed: {frame.message}")
+        return frame
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        self._stop_event.set()
+        self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._frames.close()
@@ -13,30 +13,22 @@ import sys
 
 def main() -> None:
     """Main entry point for the screensaver."""
-    args = [arg.lower() for arg in sys.argv[1:]]
+    # Windows puts the mode flag first (a window handle may follow it)
+    mode = sys.argv[1].lower() if len(sys.argv) > 1 else ""
 
-    if not args:
-        # No arguments - show config dialog
-        from .config_dialog import show_config_dialog
-        show_config_dialog()
+    if mode in ("/p", "-p"):
+        # Preview mode - not implemented, just exit before importing anything
+        # Windows passes a window handle for preview, but we skip this
+        sys.exit(0)
 
-    elif "/s" in args or "-s" in args:
+    # Dialog/screensaver modules are imported per branch so the /s path
+    # never loads tkinter (and the dialog path never loads the renderer)
+    if mode in ("/s", "-s"):
         # Run screensaver in fullscreen
         from .screensaver import run_screensaver
         run_screensaver(fullscreen=True)
-
-    elif "/c" in args or "-c" in args:
-        # Show configuration dialog
-        from .config_dialog import show_config_dialog
-        show_config_dialog()
-
-    elif "/p" in args or "-p" in args:
-        # Preview mode - not implemented, just exit
-        # Windows passes a window handle for preview, but we skip this
-        sys.exit(0)
-
     else:
-        # Unknown argument - show config dialog
+        # /c, no args or an unknown argument - show configuration dialog
         from .config_dialog import show_config_dialog
         show_config_dialog()
 
@@ -1,25 +1,92 @@
 """ANSI escape code parser and pygame renderer."""
 
-import os
 import re
 import sys
-from typing import Tuple, List, Optional, Dict, Set
+from collections import OrderedDict
+from typing import Tuple, List, Optional, Dict
 from pathlib import Path
 import pygame
 
 
-# ANSI escape code patterns - pre-compiled for speed
-ANSI_ESCAPE = re.compile(r"\x1b\[([0-9;]*)m")
-ANSI_CURSOR_POS = re.compile(r"\x1b\[(\d+);(\d+)H")
-ANSI_CLEAR = re.compile(r"\x1b\[2?J")
-ANSI_ANY = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# Single tokenizer for a whole frame - one finditer scan instead of probing
+# several patterns at every character. Every CSI sequence is one token
+# (params + final byte), dispatched on the final byte like a terminal's
+# state machine would. Token kind is match.lastindex:
+ANSI_TOKEN = re.compile(
+    r"\x1b\[([0-9;]*)([A-Za-z])"  # 2: CSI sequence (params, final byte)
+    r"|(\n)"                      # 3: newline
+    r"|(\r)"                      # 4: carriage return
+    r"|([^\x1b\n\r]+|\x1b)",      # 5: run of plain text (or a stray ESC)
+)
+TOKEN_CSI = 2
+TOKEN_NEWLINE = 3
+TOKEN_CR = 4
+TOKEN_TEXT = 5
 
 # Type alias for cell data
 CellData = Tuple[str, Tuple[int, int, int]]  # (char, color)
-
-
-def get_bundled_font_path() -> Optional[Path]:
-    """Get path to the bundled font file."""
+SparseCell = Tuple[int, int, str, Tuple[int, int, int]]  # (row, col, char, color)
+CellMap = Dict[Tuple[int, int], CellData]  # (row, col) -> (char, color)
+
+# Max rendered glyph surfaces kept - gradient-heavy effects produce a new
+# (char, color) pair almost every frame, so an unbounded cache keeps growing
+GLYPH_CACHE_SIZE = 16384
+
+# Max decoded SGR parameter strings kept (cleared wholesale when full)
+SGR_CACHE_SIZE = 4096
+
+# Characters that draw nothing - cells holding them are left out of a frame
+BLANK_CHARS = " \t\xa0"
+_BLANK_CHAR_SET = frozenset(BLANK_CHARS)
+
+# Marks an SGR string that hasn't been decoded yet (None means "no change")
+_SGR_UNCACHED = object()
+
+# pygame-ce's Surface.fblits skips blits()' per-item return handling
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Standard 16 ANSI colors: 0-7 normal, 8-15 bright
+ANSI_16_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    (0, 0, 0),        # Black
+    (170, 0, 0),      # Red
+    (0, 170, 0),      # Green
+    (170, 85, 0),     # Yellow/Brown
+    (0, 0, 170),      # Blue
+    (170, 0, 170),    # Magenta
+    (0, 170, 170),    # Cyan
+    (170, 170, 170),  # White
+    (85, 85, 85),     # Bright Black (Gray)
+    (255, 85, 85),    # Bright Red
+    (85, 255, 85),    # Bright Green
+    (255, 255, 85),   # Bright Yellow
+    (85, 85, 255),    # Bright Blue
+    (255, 85, 255),   # Bright Magenta
+    (85, 255, 255),   # Bright Cyan
+    (255, 255, 255),  # Bright White
+)
+
+# SGR foreground codes 30-37 / 90-97 mapped straight to their RGB
+SGR_FOREGROUND_COLORS: Dict[int, Tuple[int, int, int]] = {
+    **{30 + i: ANSI_16_COLORS[i] for i in range(8)},
+    **{90 + i: ANSI_16_COLORS[8 + i] for i in range(8)},
+}
+
+
+def _build_xterm_palette() -> Tuple[Tuple[int, int, int], ...]:
+    """Build the full xterm 256-color palette as an RGB lookup table."""
+    # 6x6x6 color cube uses xterm's channel levels, not evenly spaced steps
+    levels = (0, 95, 135, 175, 215, 255)
+    cube = [(levels[r], levels[g], levels[b]) for r in range(6) for g in range(6) for b in range(6)]
+    # 24-step grayscale ramp: 8, 18, ..., 238
+    grays = [(v, v, v) for v in range(8, 248, 10)]
+    return ANSI_16_COLORS + tuple(cube) + tuple(grays)
+
+
+XTERM_256_COLORS = _build_xterm_palette()
+
+
+def _resolve_bundled_font_path() -> Optional[Path]:
+    """Locate the bundled font file on disk."""
     # When running from source
     src_dir = Path(__file__).parent.parent
     font_path = src_dir / "assets" / "font.ttf"
@@ -36,6 +103,23 @@ def get_bundled_font_path() -> Optional[Path]:
     return None
 
 
+# The font ships alongside the code, so look for it once at import
+_BUNDLED_FONT_PATH = _resolve_bundled_font_path()
+
+
+def get_bundled_font_path() -> Optional[Path]:
+    """Get path to the bundled font file."""
+    return _BUNDLED_FONT_PATH
+
+
+def _blit_all(surface: pygame.Surface, blit_list: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+    """Blit a batch of (source, dest) pairs in a single call."""
+    if _HAS_FBLITS:
+        surface.fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=False)
+
+
 class ANSIRenderer:
     """Renders ANSI-formatted text to a pygame surface."""
 
@@ -53,17 +137,31 @@ class ANSIRenderer:
         self.font = self._get_monospace_font(font_size)
         self.char_width, self.char_height = self.font.size("M")
 
-        # Character surface cache for performance
-        self._char_cache: dict = {}
+        # Largest glyph surface rendered so far - box-drawing and block
+        # characters overhang their cell, and dirty rects must cover that
+        self._glyph_width = self.char_width
+        self._glyph_height = self.char_height
+
+        # LRU of rendered character surfaces keyed by (char, color)
+        self._char_cache: OrderedDict[CellData, pygame.Surface] = OrderedDict()
+
+        # Decoded SGR parameter string -> color (None if it doesn't set one)
+        self._sgr_cache: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+        # Once a display exists, cached surfaces are converted to its pixel
+        # format so blits never have to convert pixels on the fly
+        self._display_format = pygame.display.get_surface() is not None
 
         # Pre-create background tile for clearing cells
         self._bg_tile = pygame.Surface((self.char_width, self.char_height))
+        if self._display_format:
+            self._bg_tile = self._bg_tile.convert()
         self._bg_tile.fill(background_color)
 
     def _get_monospace_font(self, size: int) -> pygame.font.Font:
         """Get a monospace font, trying bundled font first."""
         # Try bundled font first (has full Unicode support)
-        bundled_font = get_bundled_font_path()
+        bundled_font = _BUNDLED_FONT_PATH
         if bundled_font:
             try:
                 return pygame.font.Font(str(bundled_font), size)
@@ -94,71 +192,82 @@ class ANSIRenderer:
         # Fallback to default font
         return pygame.font.Font(None, size)
 
-    def parse_ansi_frame_sparse(self, frame: str, canvas_width: int = 200, canvas_height: int = 100) -> List[Tuple[int, int, str, Tuple[int, int, int]]]:
+    def parse_ansi_frame_sparse(self, frame: str, canvas_width: int = 200, canvas_height: int = 100) -> Tuple[SparseCell, ...]:
+        """
+        Parse ANSI frame into sparse sequence of non-empty cells.
+        Returns (row, col, char, color) tuples - much faster than full grid.
+        """
+        cells = self.parse_ansi_frame_dict(frame, canvas_width, canvas_height)
+        return tuple((row, col, char, color) for (row, col), (char, color) in cells.items())
+
+    def parse_ansi_frame_dict(self, frame: str, canvas_width: int = 200, canvas_height: int = 100) -> CellMap:
         """
-        Parse ANSI frame into sparse list of non-empty cells.
-        Returns list of (row, col, char, color) tuples - much faster than full grid.
+        Parse ANSI frame into a dict of non-empty cells keyed by (row, col).
+        Tokenizes the frame in one pass.
         """
-        cells = []
+        cells: CellMap = {}
         current_color = self.default_fg_color
         cursor_row = 0
         cursor_col = 0
 
-        i = 0
-        frame_len = len(frame)
-        while i < frame_len:
-            char = frame[i]
-
-            # Check for ANSI escape sequence
-            if char == "\x1b" and i + 1 < frame_len and frame[i + 1] == "[":
-                # Try to match cursor position code first
-                pos_match = ANSI_CURSOR_POS.match(frame, i)
-                if pos_match:
-                    cursor_row = int(pos_match.group(1)) - 1
-                    cursor_col = int(pos_match.group(2)) - 1
-                    i = pos_match.end()
-                    continue
-
-                # Try to match color code
-                color_match = ANSI_ESCAPE.match(frame, i)
-                if color_match:
-                    codes = color_match.group(1).split(";")
-                    current_color = self._parse_color_codes(codes, current_color)
-                    i = color_match.end()
-                    continue
-
-                # Skip other ANSI codes
-                other_match = ANSI_ANY.match(frame, i)
-                if other_match:
-                    i = other_match.end()
-                    continue
-
-            # Handle newline
-            if char == "\n":
+        # Hot loop - bind repeatedly used attributes to locals once
+        sgr_cache = self._sgr_cache
+        sgr_get = sgr_cache.get
+        blank_chars = _BLANK_CHAR_SET
+
+        for match in ANSI_TOKEN.finditer(frame):
+            kind = match.lastindex
+
+            if kind == TOKEN_TEXT:
+                # Plain text run - only the part inside the canvas is kept
+                text = match.group(TOKEN_TEXT)
+                # Blank padding runs are the bulk of every frame - skip them
+                # with one C-level strip instead of a per-character loop
+                # (cursors never go negative, so only the far edges need checking)
+                if cursor_row < canvas_height and cursor_col < canvas_width and text.strip(BLANK_CHARS):
+                    for col, char in enumerate(text[:canvas_width - cursor_col], cursor_col):
+                        if char not in blank_chars:
+                            cells[cursor_row, col] = (char, current_color)
+                cursor_col += len(text)
+
+            elif kind == TOKEN_CSI:
+                params, final = match.group(1, TOKEN_CSI)
+
+                if final == "m":
+                    # SGR color - TTE repeats the same few SGR strings thousands
+                    # of times per frame, so each one is only decoded once
+                    color = sgr_get(params, _SGR_UNCACHED)
+                    if color is _SGR_UNCACHED:
+                        color = self._parse_color_codes(params.split(";"), None)
+                        if len(sgr_cache) >= SGR_CACHE_SIZE:
+                            sgr_cache.clear()
+                        sgr_cache[params] = color
+                    if color is not None:
+                        current_color = color
+
+                elif final == "H":
+                    # Cursor position (row;col) - other forms are ignored.
+                    # Like a terminal, 0 is treated as 1 (keeps cursors >= 0)
+                    row, sep, col = params.partition(";")
+                    if row and col and ";" not in col:
+                        cursor_row = max(int(row) - 1, 0)
+                        cursor_col = max(int(col) - 1, 0)
+
+                # Any other CSI sequence is skipped
+
+            elif kind == TOKEN_NEWLINE:
                 cursor_row += 1
                 cursor_col = 0
-                i += 1
-                continue
 
-            # Handle carriage return
-            if char == "\r":
+            elif kind == TOKEN_CR:
                 cursor_col = 0
-                i += 1
-                continue
-
-            # Non-space character - add to sparse list
-            if char != " " and 0 <= cursor_row < canvas_height and 0 <= cursor_col < canvas_width:
-                cells.append((cursor_row, cursor_col, char, current_color))
-
-            cursor_col += 1
-            i += 1
 
         return cells
 
     def _parse_color_codes(
-        self, codes: List[str], current_color: Tuple[int, int, int]
-    ) -> Tuple[int, int, int]:
-        """Parse ANSI color codes and return the resulting color."""
+        self, codes: List[str], current_color: Optional[Tuple[int, int, int]]
+    ) -> Optional[Tuple[int, int, int]]:
+        """Parse ANSI color codes and return the resulting color (or current_color if unchanged)."""
         if not codes or codes == [""]:
             return self.default_fg_color
 
@@ -202,121 +311,98 @@ class ANSIRenderer:
                             pass
                         i += 3
                         continue
-            elif 30 <= code <= 37:
-                # Standard foreground colors
-                return self._basic_color(code - 30)
-            elif 90 <= code <= 97:
-                # Bright foreground colors
-                return self._basic_color(code - 90, bright=True)
+            else:
+                # Standard (30-37) and bright (90-97) foreground colors
+                color = SGR_FOREGROUND_COLORS.get(code)
+                if color is not None:
+                    return color
 
             i += 1
 
         return current_color
 
-    def _basic_color(self, index: int, bright: bool = False) -> Tuple[int, int, int]:
-        """Convert basic ANSI color index to RGB."""
-        colors = [
-            (0, 0, 0),        # Black
-            (170, 0, 0),      # Red
-            (0, 170, 0),      # Green
-            (170, 85, 0),     # Yellow/Brown
-            (0, 0, 170),      # Blue
-            (170, 0, 170),    # Magenta
-            (0, 170, 170),    # Cyan
-            (170, 170, 170),  # White
-        ]
-        bright_colors = [
-            (85, 85, 85),     # Bright Black (Gray)
-            (255, 85, 85),    # Bright Red
-            (85, 255, 85),    # Bright Green
-            (255, 255, 85),   # Bright Yellow
-            (85, 85, 255),    # Bright Blue
-            (255, 85, 255),   # Bright Magenta
-            (85, 255, 255),   # Bright Cyan
-            (255, 255, 255),  # Bright White
-        ]
-        if bright:
-            return bright_colors[index] if index < len(bright_colors) else self.default_fg_color
-        return colors[index] if index < len(colors) else self.default_fg_color
-
     def _xterm_to_rgb(self, color_num: int) -> Tuple[int, int, int]:
-        """Convert xterm 256 color number to RGB."""
-        if color_num < 16:
-            # Standard colors
-            return self._basic_color(color_num % 8, bright=color_num >= 8)
-        elif color_num < 232:
-            # 216 color cube (6x6x6)
-            color_num -= 16
-            r = (color_num // 36) % 6
-            g = (color_num // 6) % 6
-            b = color_num % 6
-            return (
-                r * 51 if r else 0,
-                g * 51 if g else 0,
-                b * 51 if b else 0,
-            )
-        else:
-            # Grayscale
-            gray = (color_num - 232) * 10 + 8
-            return (gray, gray, gray)
+        """Convert xterm 256 color number to RGB (IndexError if out of range)."""
+        return XTERM_256_COLORS[color_num]
 
     def get_char_surface(
         self, char: str, color: Tuple[int, int, int]
     ) -> pygame.Surface:
         """Get a cached surface for a character with given color."""
         cache_key = (char, color)
-        if cache_key not in self._char_cache:
-            self._char_cache[cache_key] = self.font.render(char, True, color)
-        return self._char_cache[cache_key]
-
-    def parse_to_dict(
-        self, frame: str, canvas_width: int, canvas_height: int
-    ) -> Dict[Tuple[int, int], CellData]:
-        """Parse ANSI frame into dict keyed by (row, col) for delta comparison."""
-        cells = self.parse_ansi_frame_sparse(frame, canvas_width, canvas_height)
-        return {(row, col): (char, color) for row, col, char, color in cells}
+        char_surface = self._char_cache.get(cache_key)
+        if char_surface is not None:
+            self._char_cache.move_to_end(cache_key)
+            return char_surface
+
+        char_surface = self.font.render(char, True, color)
+        if self._display_format:
+            char_surface = char_surface.convert_alpha()
+        width, height = char_surface.get_size()
+        if width > self._glyph_width:
+            self._glyph_width = width
+        if height > self._glyph_height:
+            self._glyph_height = height
+        self._char_cache[cache_key] = char_surface
+        if len(self._char_cache) > GLYPH_CACHE_SIZE:
+            self._char_cache.popitem(last=False)
+        return char_surface
 
     def render_frame_delta(
         self,
         frame: str,
         surface: pygame.Surface,
-        prev_cells: Dict[Tuple[int, int], CellData],
+        prev_cells: CellMap,
         offset_x: int = 0,
         offset_y: int = 0,
         canvas_width: int = 200,
         canvas_height: int = 100,
-    ) -> Dict[Tuple[int, int], CellData]:
+    ) -> Tuple[CellMap, Optional[pygame.Rect]]:
         """
         Render only the delta between previous and current frame.
-        Returns the current cells dict for use as prev_cells next frame.
+        Returns the current cells dict for use as prev_cells next frame, and
+        the bounding rect of all touched cells (None if nothing changed).
         """
         # Parse current frame to dict
-        curr_cells = self.parse_to_dict(frame, canvas_width, canvas_height)
+        curr_cells = self.parse_ansi_frame_dict(frame, canvas_width, canvas_height)
 
         char_w = self.char_width
         char_h = self.char_height
         bg_tile = self._bg_tile
+        get_char_surface = self.get_char_surface
 
         # Find cells to clear (were in prev, not in curr OR changed)
         # Find cells to draw (new or changed)
         clear_list = []
         draw_list = []
+        clear_append = clear_list.append
+        draw_append = draw_list.append
 
-        # Check cells that were previously drawn
-        prev_keys = set(prev_cells.keys())
-        curr_keys = set(curr_cells.keys())
+        # Bounds of every touched cell's top-left corner, tracked as we go
+        min_x = min_y = sys.maxsize
+        max_x = max_y = -sys.maxsize
 
-        # Cells that need to be cleared (no longer present)
-        for pos in prev_keys - curr_keys:
-            row, col = pos
-            px = offset_x + col * char_w
-            py = offset_y + row * char_h
-            clear_list.append((bg_tile, (px, py)))
+        # Cells that need to be cleared (no longer present) - walk the dicts
+        # directly rather than materializing key sets every frame
+        for pos in prev_cells:
+            if pos not in curr_cells:
+                row, col = pos
+                px = offset_x + col * char_w
+                py = offset_y + row * char_h
+                clear_append((bg_tile, (px, py)))
+                if px < min_x:
+                    min_x = px
+                if px > max_x:
+                    max_x = px
+                if py < min_y:
+                    min_y = py
+                if py > max_y:
+                    max_y = py
 
         # Cells that are new or changed
-        for pos in curr_keys:
-            curr_data = curr_cells[pos]
-            prev_data = prev_cells.get(pos)
+        prev_get = prev_cells.get
+        for pos, curr_data in curr_cells.items():
+            prev_data = prev_get(pos)
 
             if prev_data != curr_data:
                 # New or changed cell - need to draw
@@ -326,16 +412,37 @@ class ANSIRenderer:
                 py = offset_y + row * char_h
                 # Clear first if there was something different
                 if prev_data is not None:
-                    clear_list.append((bg_tile, (px, py)))
-                draw_list.append((self.get_char_surface(char, color), (px, py)))
+                    clear_append((bg_tile, (px, py)))
+                draw_append((get_char_surface(char, color), (px, py)))
+                if px < min_x:
+                    min_x = px
+                if px > max_x:
+                    max_x = px
+                if py < min_y:
+                    min_y = py
+                if py > max_y:
+                    max_y = py
+
+        if not clear_list and not draw_list:
+            return curr_cells, None
 
         # Batch operations
         if clear_list:
-            surface.blits(clear_list, doreturn=False)
+            _blit_all(surface, clear_list)
         if draw_list:
-            surface.blits(draw_list, doreturn=False)
+            _blit_all(surface, draw_list)
 
-        return curr_cells
+        # One bounding rect keeps the display update call cheap while still
+        # skipping everything outside the changed area. It is sized by the
+        # largest glyph, not the cell, so overhanging pixels are presented too
+        dirty_rect = pygame.Rect(
+            min_x,
+            min_y,
+            max_x - min_x + self._glyph_width,
+            max_y - min_y + self._glyph_height,
+        )
+
+        return curr_cells, dirty_rect
 
     def render_frame(
         self,
@@ -347,22 +454,23 @@ class ANSIRenderer:
         canvas_height: int = 100,
     ) -> None:
         """Render an ANSI frame using sparse parsing + batch blitting."""
-        # Parse to sparse list (only non-empty cells)
-        cells = self.parse_ansi_frame_sparse(frame, canvas_width, canvas_height)
+        # Parse to sparse cells (only non-empty ones)
+        cells = self.parse_ansi_frame_dict(frame, canvas_width, canvas_height)
 
         if not cells:
             return
 
-        # Build blit list directly from sparse cells
+        # Build blit list directly from the cells - no intermediate tuple
         char_w = self.char_width
         char_h = self.char_height
+        get_char_surface = self.get_char_surface
         blit_list = [
-            (self.get_char_surface(char, color), (offset_x + col * char_w, offset_y + row * char_h))
-            for row, col, char, color in cells
+            (get_char_surface(char, color), (offset_x + col * char_w, offset_y + row * char_h))
+            for (row, col), (char, color) in cells.items()
         ]
 
         # Batch blit all characters at once
-        surface.blits(blit_list, doreturn=False)
+        _blit_all(surface, blit_list)
 
     def calculate_text_dimensions(self, text: str) -> Tuple[int, int]:
         """Calculate the pixel dimensions needed to render text."""
@@ -372,5 +480,6 @@ class ANSIRenderer:
         return (max_width * self.char_width, height * self.char_height)
 
     def clear_cache(self) -> None:
-        """Clear the character surface cache."""
+        """Clear the character surface and SGR caches."""
         self._char_cache.clear()
+        self._sgr_cache.clear()
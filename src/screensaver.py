@@ -1,15 +1,16 @@
 """Main screensaver pygame loop."""
 
+import functools
 import os
 import sys
 import random
 import pygame
 from dataclasses import dataclass
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List
 
 from .config import Config, load_config
-from .renderer import ANSIRenderer, CellData
-from .effects import EffectManager
+from .renderer import ANSIRenderer, CellMap
+from .effects import EffectProcess, filter_enabled_effects
 
 
 @dataclass
@@ -21,10 +22,12 @@ class MonitorInfo:
     height: int
 
 
+@functools.lru_cache(maxsize=1)
 def get_virtual_desktop_size() -> Tuple[int, int, int, int]:
     """
     Get the virtual desktop bounds (covers all monitors).
     Returns (x, y, width, height) where x,y is the top-left corner.
+    Cached - the desktop layout is fixed for a screensaver session.
     """
     try:
         import ctypes
@@ -42,10 +45,12 @@ def get_virtual_desktop_size() -> Tuple[int, int, int, int]:
     return (0, 0, info.current_w, info.current_h)
 
 
+@functools.lru_cache(maxsize=1)
 def get_monitors() -> List[MonitorInfo]:
     """
     Get information about all connected monitors.
     Returns list of MonitorInfo with position and size.
+    Cached like get_virtual_desktop_size (treat the list as read-only).
     """
     monitors = []
 
@@ -112,8 +117,9 @@ class MonitorEffect:
         self.canvas_width = monitor.width // renderer.char_width
         self.canvas_height = monitor.height // renderer.char_height
 
-        # Create effect manager for this monitor with unique starting effect
-        self.effect_manager = EffectManager(
+        # Generate this monitor's effects in a worker process, with a unique
+        # starting effect
+        self.effect_manager = EffectProcess(
             text=config.ascii_art,
             enabled_effects=config.enabled_effects,
             canvas_width=self.canvas_width,
@@ -121,31 +127,52 @@ class MonitorEffect:
             start_index=start_index,
         )
 
-        # Track previous frame for delta rendering
-        self._prev_cells: Dict[Tuple[int, int], CellData] = {}
+        # Screen area owned by this monitor (cleared whenever the effect changes)
+        self.rect = pygame.Rect(self.offset_x, self.offset_y, monitor.width, monitor.height)
 
-    def update_and_render(self, surface: pygame.Surface) -> None:
-        """Get next frame and render to the surface using delta rendering."""
+        # Track previous frame for delta rendering
+        self._prev_frame: Optional[str] = None
+        self._prev_cells: CellMap = {}
+
+    def update_and_render(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Get next frame and render to the surface using delta rendering.
+        Returns the screen area that changed, or None if nothing did.
+        """
         frame = self.effect_manager.get_next_frame()
 
         if frame is None:
-            # Effect completed, switch to next random effect
-            self.effect_manager.switch_to_next_effect()
-            # Reset prev_cells on effect switch (need full redraw)
+            # Effect completed - the worker moves on to the next one by
+            # itself, so just wipe the old effect's leftovers once and let
+            # the next frame draw from scratch
+            self._prev_frame = None
+            if not self._prev_cells:
+                return None
+            surface.fill(self.config.background_color, self.rect)
             self._prev_cells = {}
-            frame = self.effect_manager.get_next_frame()
-
-        if frame:
-            # Use delta rendering - only update changed cells
-            self._prev_cells = self.renderer.render_frame_delta(
-                frame,
-                surface,
-                self._prev_cells,
-                offset_x=self.offset_x,
-                offset_y=self.offset_y,
-                canvas_width=self.canvas_width,
-                canvas_height=self.canvas_height,
-            )
+            return self.rect
+
+        if not frame or frame == self._prev_frame:
+            # Worker hasn't produced a new frame yet, or the effect is
+            # holding - one string compare beats diffing every cell
+            return None
+        self._prev_frame = frame
+
+        # Use delta rendering - only update changed cells
+        self._prev_cells, dirty_rect = self.renderer.render_frame_delta(
+            frame,
+            surface,
+            self._prev_cells,
+            offset_x=self.offset_x,
+            offset_y=self.offset_y,
+            canvas_width=self.canvas_width,
+            canvas_height=self.canvas_height,
+        )
+        return dirty_rect
+
+    def close(self) -> None:
+        """Stop this monitor's effect worker."""
+        self.effect_manager.close()
 
 
 class Screensaver:
@@ -164,6 +191,9 @@ class Screensaver:
         self.initial_mouse_pos: Optional[Tuple[int, int]] = None
         self.mouse_move_threshold = 10
 
+        # Present the whole screen (not just dirty rects) on the next frame
+        self._needs_full_update = True
+
     def _init_pygame(self, fullscreen: bool = True) -> Tuple[int, int]:
         """Initialize pygame and create the display."""
         if fullscreen:
@@ -195,22 +225,27 @@ class Screensaver:
         pygame.display.set_caption("TTE Screensaver")
         self.clock = pygame.time.Clock()
 
+        # Only queue the events we react to - SDL drops the rest before
+        # they ever become Python objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEMOTION,
+            pygame.VIDEOEXPOSE,
+        ])
+
         return screen_size
 
     def _handle_events(self) -> bool:
         """Handle pygame events. Returns False if should exit."""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
+            event_type = event.type
 
-            if event.type == pygame.KEYDOWN:
-                return False
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                return False
-
-            if event.type == pygame.MOUSEMOTION:
-                current_pos = pygame.mouse.get_pos()
+            if event_type == pygame.MOUSEMOTION:
+                # Most frequent event by far, so it's checked first
+                current_pos = event.pos
                 if self.initial_mouse_pos is None:
                     self.initial_mouse_pos = current_pos
                 else:
@@ -219,6 +254,13 @@ class Screensaver:
                     if dx > self.mouse_move_threshold or dy > self.mouse_move_threshold:
                         return False
 
+            elif event_type in (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                return False
+
+            elif event_type == pygame.VIDEOEXPOSE:
+                # Window contents were lost - dirty rects alone won't restore them
+                self._needs_full_update = True
+
         return True
 
     def run(self, fullscreen: bool = True) -> None:
@@ -248,19 +290,26 @@ class Screensaver:
                 print(f"  Monitor {i+1}: {m.width}x{m.height} at ({m.x}, {m.y})", file=sys.stderr)
 
             # Create independent effect for each monitor with different starting effects
-            # Spread start indices apart so monitors don't show same effect
-            num_effects = len(self.config.enabled_effects)
+            # Distinct random start indices so monitors never open on the same
+            # effect (spread evenly if there are more monitors than effects).
+            # Indices are into the filtered list, the one EffectManager uses
+            num_effects = len(filter_enabled_effects(self.config.enabled_effects))
+            if num_effects >= len(monitors):
+                start_indices = random.sample(range(num_effects), k=len(monitors))
+            else:
+                start_indices = [i * num_effects // len(monitors) for i in range(len(monitors))]
             self.monitor_effects = [
                 MonitorEffect(
                     monitor, self.config, self.renderer, virtual_origin,
-                    start_index=(i * num_effects // len(monitors)) + random.randint(0, 5)
+                    start_index=start_index,
                 )
-                for i, monitor in enumerate(monitors)
+                for monitor, start_index in zip(monitors, start_indices)
             ]
 
             self.running = True
 
-            # Clear screen once at startup (delta rendering handles subsequent frames)
+            # Clear screen once at startup (delta rendering handles subsequent
+            # frames, and each monitor clears its own area on effect switch)
             self.screen.fill(self.config.background_color)
 
             while self.running:
@@ -270,17 +319,30 @@ class Screensaver:
 
                 # Render each monitor's effect using delta rendering
                 # (only updates changed cells, much faster than full redraw)
+                dirty_rects = []
                 for monitor_effect in self.monitor_effects:
-                    monitor_effect.update_and_render(self.screen)
+                    dirty_rect = monitor_effect.update_and_render(self.screen)
+                    if dirty_rect is not None:
+                        dirty_rects.append(dirty_rect)
+
+                # Only push the changed areas to the display
+                if self._needs_full_update:
+                    pygame.display.flip()
+                    self._needs_full_update = False
+                elif dirty_rects:
+                    pygame.display.update(dirty_rects)
 
-                pygame.display.flip()
                 self.clock.tick(self.config.target_fps)
 
         except Exception as e:
             print(f"Screensaver error: {e}", file=sys.stderr)
             raise
         finally:
+            # Take the window down first - the user is already back at their
+            # desktop while the workers shut down
             pygame.quit()
+            for monitor_effect in self.monitor_effects:
+                monitor_effect.close()
 
 
 def run_screensaver(fullscreen: bool = True, config: Optional[Config] = None) -> None: